@@ -4,8 +4,6 @@ import { ErrorBoundary } from './components/ErrorBoundary';
 import { Header } from './components/Layout/Header';
 import { Sidebar } from './components/Layout/Sidebar';
 import { QuickStats } from './components/Dashboard/QuickStats';
-import { ModularPatientDashboard } from './components/ModularPatientDashboard';
-import { ModularPatientSystemDemo } from './components/ModularPatientSystemDemo';
 import { useMultiTenantPatients } from './features/patients/hooks/useMultiTenantPatients';
 import { useTenant } from './contexts/TenantContext';
 import { getPatientByMedicationId } from './services/clinical/medicationService';
@@ -32,6 +30,8 @@ function SafeSuspense({ children, fallback }: { children: React.ReactNode; fallb
 
 // Lazy-loaded feature components for better code splitting
 const PatientCard = lazy(() => import('./features/patients/components/records/PatientCard'));
+const ModularPatientDashboard = lazy(() => import('./components/ModularPatientDashboard').then(module => ({ default: module.ModularPatientDashboard })));
+const ModularPatientSystemDemo = lazy(() => import('./components/ModularPatientSystemDemo').then(module => ({ default: module.ModularPatientSystemDemo })));
 const AdminDashboard = lazy(() => import('./features/admin/components/AdminDashboard'));
 // Simulation components restored from commit 01ec049
 const SimulationManager = lazy(() => import('./features/simulation/components/SimulationManager'));
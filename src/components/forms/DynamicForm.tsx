@@ -14,7 +14,7 @@
  * - Clinical alerts and warnings
  */
 
-import React, { useState, useEffect, useCallback, useMemo } from 'react';
+import React, { useState, useEffect, useCallback, useMemo, useRef } from 'react';
 import { AlertTriangle, CheckCircle, ChevronLeft, ChevronRight, Save } from 'lucide-react';
 import { schemaEngine } from '../../lib/infrastructure/schemaEngine';
 import { 
@@ -68,6 +68,7 @@ export const DynamicForm: React.FC<DynamicFormProps> = ({
   const [currentStep, setCurrentStep] = useState(0);
   const [isSubmitting, setIsSubmitting] = useState(false);
   const [autoSaveStatus, setAutoSaveStatus] = useState<'idle' | 'saving' | 'saved' | 'error'>('idle');
+  const lastAutoSavedData = useRef<string | null>(null);
 
   // Generate form configuration with retry mechanism
   const formConfig = useMemo(() => {
@@ -106,11 +107,17 @@ export const DynamicForm: React.FC<DynamicFormProps> = ({
     const autoSaveTimer = setInterval(async () => {
       if (Object.keys(formData).length === 0) return;
 
+      // Skip the save cycle entirely when nothing changed since the last
+      // auto-save — otherwise every tick revalidates an identical payload
+      const serialized = JSON.stringify(formData);
+      if (serialized === lastAutoSavedData.current) return;
+
       setAutoSaveStatus('saving');
       try {
         const validationResult = await validateForm(formData);
         if (validationResult.valid) {
           // Here you would typically save to backend
+          lastAutoSavedData.current = serialized;
           setAutoSaveStatus('saved');
           setTimeout(() => setAutoSaveStatus('idle'), 2000);
         } else {
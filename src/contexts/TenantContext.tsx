@@ -1,9 +1,10 @@
 import React, { createContext, useContext, useEffect, useState } from 'react';
 import { Tenant } from '../types';
-import { 
-  getCurrentUserTenant, 
+import {
+  getCurrentUserTenant,
   getTenantById,
-  getTenantBySubdomain
+  getTenantBySubdomain,
+  clearUserTenantCache
 } from '../services/admin/tenantService';
 import { getUserProgramTenants, type ProgramTenant } from '../services/admin/programService';
 import { 
@@ -665,6 +666,8 @@ export const TenantProvider: React.FC<{ children: React.ReactNode }> = ({ childr
    * Refresh current tenant data
    */
   const refreshTenant = async () => {
+    // Explicit refresh must bypass the cached user→tenant resolution
+    clearUserTenantCache();
     await loadCurrentTenant();
   };
 
@@ -46,9 +46,12 @@ const PatientBraceletsModal: React.FC<PatientBraceletsModalProps> = ({ patients,
     // Pre-generate QR data URLs before building print content
     const patientBarcodeValues = duplicatedPatients.map(p => `PT${p.patient_id.slice(-8).toUpperCase()}`);
     const QRCode = await import('qrcode');
-    const patientQRs = await Promise.all(patientBarcodeValues.map(v =>
-      QRCode.toDataURL(v, { width: 80, margin: 1, color: { dark: '#000000', light: '#ffffff' } })
-    ));
+    // Each patient repeats `quantity` times — encode each unique value once and reuse
+    const uniquePatientValues = [...new Set(patientBarcodeValues)];
+    const patientQRByValue = new Map(await Promise.all(uniquePatientValues.map(async v =>
+      [v, await QRCode.toDataURL(v, { width: 80, margin: 1, color: { dark: '#000000', light: '#ffffff' } })] as const
+    )));
+    const patientQRs = patientBarcodeValues.map(v => patientQRByValue.get(v)!);
 
     const printContent = `
       <!DOCTYPE html>
@@ -261,9 +264,12 @@ const MedicationLabelsModal: React.FC<MedicationLabelsModalProps> = ({ medicatio
     // Pre-generate QR data URLs before building print content
     const medBarcodeValues = duplicatedMedications.map(m => getMedBarcodeValue(m));
     const QRCode = await import('qrcode');
-    const medQRs = await Promise.all(medBarcodeValues.map(v =>
-      QRCode.toDataURL(v, { width: 80, margin: 1, color: { dark: '#000000', light: '#ffffff' } })
-    ));
+    // Each medication repeats `quantity` times — encode each unique value once and reuse
+    const uniqueMedValues = [...new Set(medBarcodeValues)];
+    const medQRByValue = new Map(await Promise.all(uniqueMedValues.map(async v =>
+      [v, await QRCode.toDataURL(v, { width: 80, margin: 1, color: { dark: '#000000', light: '#ffffff' } })] as const
+    )));
+    const medQRs = medBarcodeValues.map(v => medQRByValue.get(v)!);
 
     const printContent = `
       <!DOCTYPE html>
@@ -1,4 +1,4 @@
-import React, { useState, useEffect, useCallback } from 'react';
+import React, { useState, useEffect, useCallback, useMemo } from 'react';
 import {
   Package,
   Plus,
@@ -116,17 +116,20 @@ export const MedicationCatalogAdmin: React.FC = () => {
 
   useEffect(() => { load(); }, [load]);
 
+  // Auto-suggest the next MZ barcode based on the highest existing one.
+  // Memoized so the catalog is only scanned when entries change, not on
+  // every open of the create modal.
+  const nextBarcode = useMemo(() => {
+    const mzNums = entries
+      .map((e) => e.barcode.match(/^MZ(\d+)$/i))
+      .filter(Boolean)
+      .map((m) => parseInt(m![1], 10));
+    const max = mzNums.length > 0 ? Math.max(...mzNums) : 0;
+    return `MZ${String(max + 1).padStart(3, '0')}`;
+  }, [entries]);
+
   const openCreate = () => {
     setEditing(null);
-    // Auto-suggest the next MZ barcode based on the highest existing one
-    const nextBarcode = (() => {
-      const mzNums = entries
-        .map((e) => e.barcode.match(/^MZ(\d+)$/i))
-        .filter(Boolean)
-        .map((m) => parseInt(m![1], 10));
-      const max = mzNums.length > 0 ? Math.max(...mzNums) : 0;
-      return `MZ${String(max + 1).padStart(3, '0')}`;
-    })();
     setForm({ ...emptyForm(), barcode: nextBarcode });
     setError('');
     setSuccess('');
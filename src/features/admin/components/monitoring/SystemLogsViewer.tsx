@@ -204,6 +204,8 @@ export const SystemLogsViewer: React.FC = () => {
     a.href = url;
     a.download = `system-logs-${new Date().toISOString()}.csv`;
     a.click();
+    // Release the object URL — without this each export leaks the full CSV blob
+    window.URL.revokeObjectURL(url);
   };
 
   const filteredLogs = logs.filter(log => {
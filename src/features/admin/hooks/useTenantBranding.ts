@@ -4,6 +4,30 @@ import { secureLogger } from '../../../lib/security/secureLogger';
 import { getTenantBySubdomain } from '../../../services/admin/tenantService';
 import { Tenant } from '../../../types';
 
+// Branding is keyed by subdomain, which cannot change without a full page
+// load — cache the lookup at module scope so every mount of a login or
+// portal screen doesn't re-query the tenants table. Storing the promise
+// also dedupes concurrent mounts into a single request.
+let brandingCache: { subdomain: string; promise: Promise<{ data: Tenant | null; error: any }> } | null = null;
+
+const fetchTenantBranding = async (subdomain: string): Promise<{ data: Tenant | null; error: any }> => {
+  if (!brandingCache || brandingCache.subdomain !== subdomain) {
+    brandingCache = { subdomain, promise: getTenantBySubdomain(subdomain) };
+  }
+  // Don't cache failures — a transient error on first paint would otherwise
+  // stick until a full page load. Clearing lets the next mount retry.
+  try {
+    const result = await brandingCache.promise;
+    if (result.error) {
+      brandingCache = null;
+    }
+    return result;
+  } catch (err) {
+    brandingCache = null;
+    throw err;
+  }
+};
+
 /**
  * Hook to get tenant information for branding purposes
  * Works in both authenticated and unauthenticated contexts
@@ -32,8 +56,8 @@ export const useTenantBranding = () => {
           return;
         }
 
-        // Fetch tenant by subdomain
-        const { data: tenantData, error: tenantError } = await getTenantBySubdomain(subdomain);
+        // Fetch tenant by subdomain (cached for the lifetime of the page)
+        const { data: tenantData, error: tenantError } = await fetchTenantBranding(subdomain);
         
         if (tenantError) {
           secureLogger.error('Tenant Branding: Error fetching tenant', tenantError);
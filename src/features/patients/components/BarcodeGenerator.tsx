@@ -109,10 +109,17 @@ export const BarcodeGenerator: React.FC<BarcodeGeneratorProps> = ({
     const canvas = canvasRef.current;
     if (!canvas) return;
 
-    const link = document.createElement('a');
-    link.download = `${type}-barcode-${data}.png`;
-    link.href = canvas.toDataURL();
-    link.click();
+    // toBlob avoids the synchronous base64 round trip of toDataURL —
+    // the PNG bytes go straight into a blob URL for the download
+    canvas.toBlob((blob) => {
+      if (!blob) return;
+      const url = URL.createObjectURL(blob);
+      const link = document.createElement('a');
+      link.download = `${type}-barcode-${data}.png`;
+      link.href = url;
+      link.click();
+      URL.revokeObjectURL(url);
+    });
   };
 
   return (
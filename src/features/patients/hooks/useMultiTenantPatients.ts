@@ -1,5 +1,5 @@
 import { useQuery, useMutation, useQueryClient } from '@tanstack/react-query';
-import { VitalSigns, PatientNote } from '../../../types';
+import { Patient, VitalSigns, PatientNote } from '../../../types';
 import {
   getPatientsByTenant,
   createPatientWithTenant,
@@ -85,9 +85,32 @@ export function useMultiTenantPatients() {
       if (!currentTenant) throw new Error('No tenant selected');
       return addVitalsWithTenant(patientId, vitals, currentTenant.id);
     },
-    onSuccess: (_, { patientId }) => {
+    onSuccess: (result, { patientId }) => {
       queryClient.invalidateQueries({ queryKey: ['patient', patientId] });
-      queryClient.invalidateQueries({ queryKey: ['patients', currentTenant?.id] });
+
+      // Append the new reading to the cached tenant list instead of
+      // invalidating it — a full refetch reloads every patient (with vitals)
+      // for a single inserted row
+      const newVitals = result.data;
+      if (newVitals) {
+        queryClient.setQueryData(
+          ['patients', currentTenant?.id],
+          (cached: { data: Patient[] | null; error: any } | undefined) => {
+            if (!cached?.data) return cached;
+            return {
+              ...cached,
+              data: cached.data.map(patient =>
+                patient.id === patientId
+                  ? { ...patient, vitals: [newVitals, ...patient.vitals] }
+                  : patient
+              )
+            };
+          }
+        );
+      } else {
+        // Insert failed or returned nothing — fall back to a refetch
+        queryClient.invalidateQueries({ queryKey: ['patients', currentTenant?.id] });
+      }
     }
   });
 
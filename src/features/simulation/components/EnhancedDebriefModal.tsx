@@ -12,7 +12,9 @@ import { X, Printer, Download, Clock, Users, Activity, TrendingUp, CheckCircle,
 import { format, differenceInMinutes } from 'date-fns';
 import { getStudentActivitiesBySimulation, type StudentActivity } from '../../../services/simulation/studentActivityService';
 import { regenerateDebriefSnapshot } from '../../../services/simulation/simulationService';
-import { generateStudentActivityPDF, generateStudentActivityPDFBlob } from '../../../utils/reactPdfGenerator';
+// PDF generation (and @react-pdf/renderer behind it) is loaded on demand
+// when the user exports — keeps the heavy renderer out of the initial bundle
+const loadPdfGenerator = () => import('../../../utils/reactPdfGenerator');
 import type { Database } from '../../../types/supabase';
 import { secureLogger } from '../../../lib/security/secureLogger';
 import { StudentActivitySection } from './DebriefStudentSection';
@@ -78,7 +80,8 @@ const EnhancedDebriefModal: React.FC<EnhancedDebriefModalProps> = ({ historyReco
         existing.activities.intakeOutput.push(...activity.activities.intakeOutput);
         existing.totalEntries += activity.totalEntries;
       } else {
-        const cloned = JSON.parse(JSON.stringify(activity));
+        // structuredClone beats the JSON round trip — no string materialization
+        const cloned = structuredClone(activity);
         cloned.studentName = activity.studentName.trim();
         studentMap.set(normalizedName, cloned);
       }
@@ -242,6 +245,7 @@ const EnhancedDebriefModal: React.FC<EnhancedDebriefModalProps> = ({ historyReco
     if (isExporting) return;
     setIsExporting(true);
     try {
+      const { generateStudentActivityPDF } = await loadPdfGenerator();
       await generateStudentActivityPDF(buildPdfData());
     } catch (error) {
       secureLogger.error('PDF export failed:', error);
@@ -254,6 +258,7 @@ const EnhancedDebriefModal: React.FC<EnhancedDebriefModalProps> = ({ historyReco
     if (isExporting) return;
     setIsExporting(true);
     try {
+      const { generateStudentActivityPDFBlob } = await loadPdfGenerator();
       const blob = await generateStudentActivityPDFBlob(buildPdfData());
       const url = URL.createObjectURL(blob);
       window.open(url, '_blank');
@@ -20,6 +20,9 @@ class SuperAdminTenantService {
     tenantName: null,
     hasAccess: false
   };
+  // User whose super admin role has already been verified this session —
+  // lets repeated initialization calls skip the profile query and re-switch
+  private verifiedUserId: string | null = null;
 
   private constructor() {}
 
@@ -35,22 +38,36 @@ class SuperAdminTenantService {
    */
   async initializeSuperAdminAccess(): Promise<boolean> {
     try {
+      const userId = (await supabase.auth.getUser()).data.user?.id;
+      const savedTenantId = this.getSavedTenantContext();
+
+      // Already initialized for this user with the same tenant context —
+      // nothing changed, so skip the role re-check and the re-switch RPC
+      if (
+        this.currentTenantAccess.hasAccess &&
+        this.verifiedUserId === userId &&
+        savedTenantId === this.currentTenantAccess.tenantId
+      ) {
+        return true;
+      }
+
       // Check if user is super admin
       const { data: profile, error } = await supabase
         .from('user_profiles')
         .select('role, id')
-        .eq('id', (await supabase.auth.getUser()).data.user?.id)
+        .eq('id', userId)
         .single();
 
       if (error || profile?.role !== 'super_admin') {
         this.currentTenantAccess.hasAccess = false;
+        this.verifiedUserId = null;
         return false;
       }
 
       this.currentTenantAccess.hasAccess = true;
-      
+      this.verifiedUserId = profile.id;
+
       // Check for saved tenant context
-      const savedTenantId = this.getSavedTenantContext();
       if (savedTenantId) {
         await this.switchToTenant(savedTenantId);
       }
@@ -554,10 +554,34 @@ export async function getAvailableAdminUsers(): Promise<{ data: { id: string; em
 /**
  * Get current user's tenant
  */
+// Cache the resolved tenant per user so repeated context loads (auth state
+// changes, provider remounts) don't re-run the two-round-trip RPC + tenant
+// lookup when nothing has changed. TTL matches the React Query staleTime.
+const USER_TENANT_CACHE_TTL_MS = 5 * 60 * 1000;
+let userTenantCache: { userId: string; tenant: Tenant; fetchedAt: number } | null = null;
+
+/**
+ * Drop the cached user→tenant resolution
+ * Call when tenant membership may have changed (explicit refresh, tenant switch)
+ */
+export function clearUserTenantCache(): void {
+  userTenantCache = null;
+}
+
 export async function getCurrentUserTenant(userId: string): Promise<{ data: Tenant | null; error: any }> {
   try {
     secureLogger.debug('🔍 getCurrentUserTenant: Starting for user:', userId);
-    
+
+    // Serve from cache while fresh — only re-resolve on staleness
+    if (
+      userTenantCache &&
+      userTenantCache.userId === userId &&
+      Date.now() - userTenantCache.fetchedAt < USER_TENANT_CACHE_TTL_MS
+    ) {
+      secureLogger.debug('🔍 getCurrentUserTenant: Returning cached tenant:', userTenantCache.tenant.name);
+      return { data: userTenantCache.tenant, error: null };
+    }
+
     // Get access token from Supabase's own session (in-memory / secure storage, no sessionStorage needed)
     const { data: sessionData } = await supabase.auth.getSession();
     const accessToken = sessionData?.session?.access_token ?? null;
@@ -622,6 +646,7 @@ export async function getCurrentUserTenant(userId: string): Promise<{ data: Tena
         
         const tenant = tenants[0];
         secureLogger.debug('🔍 getCurrentUserTenant: Success via direct fetch, returning tenant:', tenant.name);
+        userTenantCache = { userId, tenant, fetchedAt: Date.now() };
         return { data: tenant, error: null };
         
       } catch (fetchError) {
@@ -675,6 +700,7 @@ export async function getCurrentUserTenant(userId: string): Promise<{ data: Tena
     }
 
     secureLogger.debug('🔍 getCurrentUserTenant: Success, returning tenant:', tenant.name);
+    userTenantCache = { userId, tenant, fetchedAt: Date.now() };
     return { data: tenant, error: null };
   } catch (error) {
     secureLogger.error('Error fetching current user tenant:', error);
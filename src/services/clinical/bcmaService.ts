@@ -41,11 +41,20 @@ export interface BCMAValidationResult {
 }
 
 class BCMAService {
+  // Derived barcodes are recomputed on every label render and scan
+  // validation — memoize per medication since the inputs (id + name) are
+  // immutable for a given row
+  private medicationBarcodeCache = new Map<string, string>();
+
   // Generate medication barcode ID - ULTRA-SHORT for heavy label scanning
   generateMedicationBarcode(medication: Medication): string {
     // Catalog medications have a pre-assigned stable barcode (MZ001-MZ999)
     if (medication.barcode) return medication.barcode;
 
+    const cacheKey = `${medication.id}:${medication.name}`;
+    const cached = this.medicationBarcodeCache.get(cacheKey);
+    if (cached) return cached;
+
     // Create ultra-short medication code for maximum bar width
     // Format: M + 1 char + 5 digits = 7 total characters (optimal for scanning)
     
@@ -71,7 +80,8 @@ class BCMAService {
     secureLogger.debug('🔵 Original name:', medication.name, 'Clean name:', cleanName);
     secureLogger.debug('🔵 Name prefix (1 char):', namePrefix, 'ID suffix (5 digits):', idSuffix);
     secureLogger.debug('🔵 Final barcode length:', barcode.length, '- Wider bars for heavy labels!');
-    
+
+    this.medicationBarcodeCache.set(cacheKey, barcode);
     return barcode;
   }
 
@@ -411,6 +411,42 @@ export async function getLabResults(
   return { data: results as LabResult[] | null, error };
 }
 
+/**
+ * Get lab results for several panels in one query
+ * Avoids a round trip per panel when rendering a whole patient's labs
+ */
+export async function getLabResultsForPanels(
+  panelIds: string[]
+): Promise<{ data: LabResult[] | null; error: any }> {
+  if (panelIds.length === 0) {
+    return { data: [], error: null };
+  }
+
+  const { data, error } = await supabase
+    .from('lab_results')
+    .select(`
+      *,
+      entered_by_name:user_profiles!lab_results_entered_by_fkey(first_name, last_name),
+      ack_by_name:user_profiles!lab_results_ack_by_fkey(first_name, last_name)
+    `)
+    .in('panel_id', panelIds)
+    .order('category')
+    .order('test_code');
+
+  // Flatten names
+  const results = data?.map(result => ({
+    ...result,
+    entered_by_name: result.entered_by_name
+      ? `${result.entered_by_name.first_name} ${result.entered_by_name.last_name}`.trim()
+      : null,
+    ack_by_name: result.ack_by_name
+      ? `${result.ack_by_name.first_name} ${result.ack_by_name.last_name}`.trim()
+      : null,
+  }));
+
+  return { data: results as LabResult[] | null, error };
+}
+
 /**
  * Get previous lab result for the same test (from earlier panels)
  * NOTE: Only finds results within the SAME tenant (simulation session)
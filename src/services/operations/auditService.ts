@@ -7,6 +7,20 @@ import { secureLogger } from '../../lib/security/secureLogger';
  * Handles logging of user actions for audit trail purposes
  */
 
+/**
+ * Get the current user for audit logging.
+ *
+ * Reads the locally stored session instead of supabase.auth.getUser(),
+ * which validates the token against the auth server on every call — an
+ * extra network round trip per mutation just to attribute an audit row.
+ * The session user is sufficient here; inserts are still authorized
+ * server-side by RLS on the actual request.
+ */
+export const getAuditUser = async (): Promise<User | null> => {
+  const { data: { session } } = await supabase.auth.getSession();
+  return session?.user ?? null;
+};
+
 export interface AuditLog {
   id: string;
   user_id: string;
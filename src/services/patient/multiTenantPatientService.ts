@@ -45,8 +45,7 @@ export async function getPatientsByTenant(tenantId: string): Promise<{ data: Pat
       .from('patients')
       .select(`
         *,
-        patient_vitals:patient_vitals(*),
-        patient_notes:patient_notes(*)
+        patient_vitals:patient_vitals(*)
       `)
       .eq('tenant_id', tenantId)
       .order('created_at', { ascending: false });
@@ -206,8 +205,7 @@ export async function getPatientByIdWithTenant(patientId: string, tenantId: stri
       .from('patients')
       .select(`
         *,
-        patient_vitals:patient_vitals(*),
-        patient_notes:patient_notes(*)
+        patient_vitals:patient_vitals(*)
       `)
       .eq('id', patientId)
       .eq('tenant_id', tenantId)
@@ -448,7 +446,7 @@ const convertDatabasePatient = (dbPatient: DatabasePatient, vitals?: any[]): Pat
     avatar_id: dbPatient.avatar_id,
     vitals: vitals ? convertDatabaseVitals(vitals) : [],
     medications: [], // Always initialize as empty array - medications loaded separately
-    notes: [] // Will be loaded separately
+    notes: [] // Loaded separately — do not embed patient_notes in patient selects
   };
 };
 
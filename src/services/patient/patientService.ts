@@ -1,6 +1,6 @@
 import { supabase } from '../../lib/api/supabase';
 import { Patient, VitalSigns, PatientNote } from '../../types';
-import { logAction } from '../operations/auditService';
+import { logAction, getAuditUser } from '../operations/auditService';
 import { secureLogger } from '../../lib/security/secureLogger';
 
 // Legacy type for simulation_patients table (older approach pre-multi-tenant)
@@ -232,16 +232,18 @@ export const fetchPatients = async (simulationId?: string, tenantId?: string): P
     
     secureLogger.debug('Fetching patients from database...', tenantId ? `for tenant: ${tenantId}` : '(all tenants)');
     
-    // Build query for patients
+    // Build query for patients with vitals embedded — one round trip instead
+    // of a patients query followed by a scoped vitals query, mirroring the
+    // simulation branch above
     let query = supabase
       .from('patients')
-      .select('*');
-    
+      .select('*, vitals:patient_vitals(*)');
+
     // Filter by tenant_id if provided (multi-tenant isolation)
     if (tenantId) {
       query = query.eq('tenant_id', tenantId);
     }
-    
+
     // Fetch patients
     const { data: patients, error: patientsError } = await query
       .order('created_at', { ascending: false });
@@ -257,29 +259,13 @@ export const fetchPatients = async (simulationId?: string, tenantId?: string): P
 
     secureLogger.debug(`Found ${patients.length} patients`);
 
-    // Fetch vitals for all patients
-    const { data: allVitals, error: vitalsError } = await supabase
-      .from('patient_vitals')
-      .select('*')
-      .order('recorded_at', { ascending: false });
-
-    if (vitalsError) {
-      secureLogger.error('Error fetching vitals:', vitalsError);
-    }
-
-    // Group vitals by patient
-    const vitalsByPatient = (allVitals || []).reduce((acc, vital) => {
-      if (!acc[vital.patient_id]) {
-        acc[vital.patient_id] = [];
-      }
-      acc[vital.patient_id].push(vital);
-      return acc;
-    }, {} as Record<string, DatabaseVitals[]>);
-
-    // Convert patients with their vitals
-    const patientsWithVitals = patients.map(patient => 
-      convertDatabasePatient(patient, vitalsByPatient[patient.id] || [])
-    );
+    // Convert patients with their vitals, most recent first
+    const patientsWithVitals = patients.map(({ vitals, ...patient }) => {
+      const sortedVitals = ((vitals || []) as DatabaseVitals[]).sort(
+        (a, b) => new Date(b.recorded_at).getTime() - new Date(a.recorded_at).getTime()
+      );
+      return convertDatabasePatient(patient as DatabasePatient, sortedVitals);
+    });
 
     secureLogger.debug('Patients converted successfully');
     return patientsWithVitals;
@@ -424,7 +410,7 @@ export const createPatient = async (patient: Patient): Promise<Patient> => {
     }
 
     // Log the action
-    const user = (await supabase.auth.getUser()).data.user;
+    const user = await getAuditUser();
     await logAction(
       user,
       'created_patient',
@@ -459,7 +445,7 @@ export const updatePatient = async (patient: Patient): Promise<Patient> => {
     }
 
     // Log the action
-    const user = (await supabase.auth.getUser()).data.user;
+    const user = await getAuditUser();
     await logAction(
       user,
       'updated_patient',
@@ -497,7 +483,7 @@ export const deletePatient = async (patientId: string): Promise<void> => {
     }
     
     // Log the action
-    const user = (await supabase.auth.getUser()).data.user;
+    const user = await getAuditUser();
     await logAction(
       user,
       'deleted_patient',
@@ -537,7 +523,7 @@ export const createPatientNote = async (note: any): Promise<PatientNote> => {
     }
 
     // Log the action
-    const user = (await supabase.auth.getUser()).data.user;
+    const user = await getAuditUser();
     await logAction(
       user,
       'created_note',
@@ -597,7 +583,7 @@ export const updatePatientNote = async (noteId: string, updates: Partial<Patient
     }
 
     // Log the action
-    const user = (await supabase.auth.getUser()).data.user;
+    const user = await getAuditUser();
     await logAction(
       user,
       'updated_note',
@@ -662,7 +648,7 @@ export const deletePatientNote = async (noteId: string): Promise<void> => {
     }
 
     // Log the action
-    const user = (await supabase.auth.getUser()).data.user;
+    const user = await getAuditUser();
     if (user) {
       try {
         await logAction(
@@ -760,7 +746,7 @@ export const updatePatientVitals = async (patientId: string, vitals: VitalSigns,
     }
 
     // Log the action (only log vitals that were actually recorded)
-    const user = (await supabase.auth.getUser()).data.user;
+    const user = await getAuditUser();
     const logData: any = {};
     if (vitals.temperature != null) logData.temperature = vitals.temperature;
     if (vitals.heartRate != null) logData.heart_rate = vitals.heartRate;
@@ -55,14 +55,25 @@ const CODE128_PATTERNS = [
   '11010011100', '1100011101011'
 ];
 
+// Patterns are pure functions of the encoded data, and the same IDs are
+// rendered repeatedly (label sheets, re-renders) — cache computed patterns.
+// Bounded so a long session scanning many unique codes can't grow unchecked.
+const PATTERN_CACHE_LIMIT = 500;
+const patternCache = new Map<string, string>();
+
 /**
  * Generate Code-128 barcode pattern
  * Creates a proper Code-128 barcode with start, data, checksum, and stop codes
- * 
+ *
  * @param {string} data - Data to encode in the barcode
  * @returns {string} Binary pattern string for the barcode
  */
 export const generateCode128Pattern = (data: string): string => {
+  const cached = patternCache.get(data);
+  if (cached !== undefined) {
+    return cached;
+  }
+
   // Start with Code B (104)
   let pattern = CODE128_PATTERNS[104];
   let checksum = 104;
@@ -85,7 +96,12 @@ export const generateCode128Pattern = (data: string): string => {
   // Add stop pattern
   pattern += CODE128_PATTERNS[106]; // Stop pattern
   pattern += '11'; // Final bars
-  
+
+  if (patternCache.size >= PATTERN_CACHE_LIMIT) {
+    patternCache.clear();
+  }
+  patternCache.set(data, pattern);
+
   return pattern;
 };
 
@@ -11,67 +11,15 @@ import { fetchPatientAssessments } from '../services/patient/assessmentService';
 import { fetchPatientBowelRecords } from '../services/clinical/bowelRecordService';
 import { fetchAdmissionRecord, fetchAdvancedDirective } from '../services/patient/admissionService';
 import { fetchDoctorsOrders } from '../services/clinical/doctorsOrdersService';
-import { getLabPanels, getLabResults } from '../services/clinical/labService';
+import { getLabPanels, getLabResultsForPanels } from '../services/clinical/labService';
 import type { LabPanel, LabResult } from '../features/patients/types/labs';
 import type { Patient } from '../types';
 import { secureLogger } from '../lib/security/secureLogger';
 import { escapeHtml as e } from './sanitization';
 
-export async function printPatientRecord(patient: Patient, tenantId: string): Promise<void> {
-  if (!patient?.id) {
-    alert('Patient data not available for record generation.');
-    return;
-  }
-
-  try {
-    secureLogger.debug(`Fetching data for patient record: ${patient.id}, tenant: ${tenantId}`);
-
-    const [vitalsData, medicationsData, assessmentsData, bowelRecordsData, admissionData, directiveData, ordersData, labPanelsResponse] = await Promise.all([
-      fetchPatientVitals(patient.id),
-      fetchPatientMedications(patient.id),
-      fetchPatientAssessments(patient.id),
-      fetchPatientBowelRecords(patient.id),
-      fetchAdmissionRecord(patient.id),
-      fetchAdvancedDirective(patient.id),
-      fetchDoctorsOrders(patient.id),
-      getLabPanels(patient.id, tenantId),
-    ]);
-
-    const labPanelsData = labPanelsResponse.data || [];
-
-    const labPanelsWithResults = await Promise.all(
-      labPanelsData.map(async (panel: LabPanel) => {
-        const resultsResponse = await getLabResults(panel.id);
-        return { ...panel, results: resultsResponse.data || [] };
-      })
-    );
-
-    const formattedVitalsData = vitalsData.map(vital => ({
-      ...vital,
-      bloodPressureDisplay:
-        vital.bloodPressure?.systolic && vital.bloodPressure?.diastolic
-          ? `${vital.bloodPressure.systolic}/${vital.bloodPressure.diastolic}`
-          : 'N/A',
-      respiratoryRateDisplay: vital.respiratoryRate ?? 'N/A',
-      oxygenSaturationDisplay: vital.oxygenSaturation ?? 'N/A',
-      roomAirIndicator:
-        (vital.oxygenSaturation ?? 0) >= 95 && (vital.oxygenSaturation ?? 0) <= 100 ? ' (RA)' : '',
-    }));
-
-    const reportWindow = window.open('', '_blank', 'width=1200,height=800,scrollbars=yes,resizable=yes');
-    if (!reportWindow) {
-      alert('Please allow popups to generate the patient record.');
-      return;
-    }
-
-    const htmlContent = `
-      <!DOCTYPE html>
-      <html lang="en">
-        <head>
-          <meta charset="UTF-8">
-          <meta name="viewport" content="width=device-width, initial-scale=1.0">
-          <title>Patient Medical Record - ${e(patient.first_name)} ${e(patient.last_name)}</title>
-          <style>
+// Static stylesheet for the printed record. Hoisted out of the HTML template
+// so it is built once at module load instead of re-assembled on every print.
+const RECORD_STYLES = `
             * { box-sizing: border-box; margin: 0; padding: 0; }
             body { font-family: 'Times New Roman', serif; font-size: 12px; line-height: 1.4; color: #000; background: #fff; }
             .record-container { max-width: 8.5in; margin: 0 auto; padding: 0.75in; background: white; min-height: 11in; box-shadow: 0 0 20px rgba(0,0,0,0.1); }
@@ -120,7 +68,73 @@ export async function printPatientRecord(patient: Patient, tenantId: string): Pr
             @media screen and (max-width: 768px) {
               .record-container { padding: 20px; max-width: 100%; }
               .info-grid { grid-template-columns: 1fr; }
-            }
+            }`;
+
+export async function printPatientRecord(patient: Patient, tenantId: string): Promise<void> {
+  if (!patient?.id) {
+    alert('Patient data not available for record generation.');
+    return;
+  }
+
+  try {
+    secureLogger.debug(`Fetching data for patient record: ${patient.id}, tenant: ${tenantId}`);
+
+    const [vitalsData, medicationsData, assessmentsData, bowelRecordsData, admissionData, directiveData, ordersData, labPanelsResponse] = await Promise.all([
+      fetchPatientVitals(patient.id),
+      fetchPatientMedications(patient.id),
+      fetchPatientAssessments(patient.id),
+      fetchPatientBowelRecords(patient.id),
+      fetchAdmissionRecord(patient.id),
+      fetchAdvancedDirective(patient.id),
+      fetchDoctorsOrders(patient.id),
+      getLabPanels(patient.id, tenantId),
+    ]);
+
+    const labPanelsData = labPanelsResponse.data || [];
+
+    // Fetch every panel's results in a single query instead of one per panel
+    const allResultsResponse = await getLabResultsForPanels(labPanelsData.map((panel: LabPanel) => panel.id));
+    const resultsByPanel = new Map<string, LabResult[]>();
+    (allResultsResponse.data || []).forEach((result: LabResult) => {
+      const panelResults = resultsByPanel.get(result.panel_id);
+      if (panelResults) {
+        panelResults.push(result);
+      } else {
+        resultsByPanel.set(result.panel_id, [result]);
+      }
+    });
+
+    const labPanelsWithResults = labPanelsData.map((panel: LabPanel) => ({
+      ...panel,
+      results: resultsByPanel.get(panel.id) || [],
+    }));
+
+    const formattedVitalsData = vitalsData.map(vital => ({
+      ...vital,
+      bloodPressureDisplay:
+        vital.bloodPressure?.systolic && vital.bloodPressure?.diastolic
+          ? `${vital.bloodPressure.systolic}/${vital.bloodPressure.diastolic}`
+          : 'N/A',
+      respiratoryRateDisplay: vital.respiratoryRate ?? 'N/A',
+      oxygenSaturationDisplay: vital.oxygenSaturation ?? 'N/A',
+      roomAirIndicator:
+        (vital.oxygenSaturation ?? 0) >= 95 && (vital.oxygenSaturation ?? 0) <= 100 ? ' (RA)' : '',
+    }));
+
+    const reportWindow = window.open('', '_blank', 'width=1200,height=800,scrollbars=yes,resizable=yes');
+    if (!reportWindow) {
+      alert('Please allow popups to generate the patient record.');
+      return;
+    }
+
+    const htmlContent = `
+      <!DOCTYPE html>
+      <html lang="en">
+        <head>
+          <meta charset="UTF-8">
+          <meta name="viewport" content="width=device-width, initial-scale=1.0">
+          <title>Patient Medical Record - ${e(patient.first_name)} ${e(patient.last_name)}</title>
+          <style>${RECORD_STYLES}
           </style>
         </head>
         <body>